@@ -1,6 +1,7 @@
 """Shared functionality for pipeline plugins for Blender."""
 
 import itertools
+import os
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -32,6 +33,24 @@ VALID_EXTENSIONS = [".blend", ".json", ".abc", ".fbx",
                     ".usd", ".usdc", ".usda"]
 
 
+def normalize_libpath(path) -> str:
+    """Return a normalized absolute path usable for string comparison."""
+    path = str(path)
+    # Only blend file relative paths need resolving by Blender
+    if path.startswith("//"):
+        path = bpy.path.abspath(path)
+    return os.path.normcase(os.path.normpath(path))
+
+
+def is_same_libpath(path, other_path) -> bool:
+    """Return whether both library paths point to the same file.
+
+    Symlinks are not resolved, a path that only matches through a symlink
+    is treated as a different file and gets reloaded.
+    """
+    return normalize_libpath(path) == normalize_libpath(other_path)
+
+
 def prepare_scene_name(
     folder_name: str, product_name: str, namespace: Optional[str] = None
 ) -> str:
@@ -1,5 +1,6 @@
 """Load an asset in Blender from an Alembic file."""
 
+import logging
 from pathlib import Path
 from pprint import pformat
 from typing import Dict, List, Optional
@@ -32,16 +33,28 @@ class FbxCameraLoader(plugin.BlenderLoader):
 
     def _remove(self, asset_group):
         objects = list(asset_group.children)
+        removed_objects = []
+        cameras = set()
 
         for obj in objects:
             if obj.type == 'CAMERA':
-                bpy.data.cameras.remove(obj.data)
+                cameras.add(obj.data)
             elif obj.type == 'EMPTY':
                 objects.extend(obj.children)
-                bpy.data.objects.remove(obj)
+            else:
+                continue
+            removed_objects.append(obj)
+
+        for obj in removed_objects:
+            bpy.data.objects.remove(obj)
+
+        for camera in cameras:
+            if not camera.users:
+                bpy.data.cameras.remove(camera, do_unlink=False)
 
     def _process(self, libpath, asset_group, group_name):
-        plugin.deselect_all()
+        if bpy.context.view_layer.objects.selected:
+            plugin.deselect_all()
 
         collection = bpy.context.view_layer.active_layer_collection.collection
 
@@ -105,14 +118,7 @@ class FbxCameraLoader(plugin.BlenderLoader):
         asset_group = bpy.data.objects.new(group_name, object_data=None)
         avalon_container.objects.link(asset_group)
 
-        self._process(libpath, asset_group, group_name)
-
-        objects = []
-        nodes = list(asset_group.children)
-
-        for obj in nodes:
-            objects.append(obj)
-            nodes.extend(list(obj.children))
+        objects = self._process(libpath, asset_group, group_name)
 
         bpy.context.scene.collection.objects.link(asset_group)
 
@@ -152,11 +158,12 @@ class FbxCameraLoader(plugin.BlenderLoader):
         libpath = Path(get_representation_path(repre_entity))
         extension = libpath.suffix.lower()
 
-        self.log.info(
-            "Container: %s\nRepresentation: %s",
-            pformat(container, indent=2),
-            pformat(repre_entity, indent=2),
-        )
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(
+                "Container: %s\nRepresentation: %s",
+                pformat(container, indent=2),
+                pformat(repre_entity, indent=2),
+            )
 
         assert asset_group, (
             f"The asset is not loaded: {container['objectName']}"
@@ -174,18 +181,12 @@ class FbxCameraLoader(plugin.BlenderLoader):
         metadata = asset_group.get(AVALON_PROPERTY)
         group_libpath = metadata["libpath"]
 
-        normalized_group_libpath = (
-            str(Path(bpy.path.abspath(group_libpath)).resolve())
-        )
-        normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
-        )
         self.log.debug(
-            "normalized_group_libpath:\n  %s\nnormalized_libpath:\n  %s",
-            normalized_group_libpath,
-            normalized_libpath,
+            "group_libpath:\n  %s\nlibpath:\n  %s",
+            group_libpath,
+            libpath,
         )
-        if normalized_group_libpath == normalized_libpath:
+        if plugin.is_same_libpath(group_libpath, libpath):
             self.log.info("Library already loaded, not updating...")
             return
 
@@ -1,5 +1,6 @@
 """Load an asset in Blender from an Alembic file."""
 
+import logging
 from pathlib import Path
 from pprint import pformat
 from typing import Dict, List, Optional
@@ -32,24 +33,44 @@ class FbxModelLoader(plugin.BlenderLoader):
 
     def _remove(self, asset_group):
         objects = list(asset_group.children)
+        removed_objects = []
+        datablocks = {}
+        materials = set()
 
         for obj in objects:
             if obj.type == 'MESH':
-                for material_slot in list(obj.material_slots):
-                    if material_slot.material:
-                        bpy.data.materials.remove(material_slot.material)
-                bpy.data.meshes.remove(obj.data)
+                materials.update(
+                    material_slot.material
+                    for material_slot in obj.material_slots
+                    if material_slot.material
+                )
+                datablocks[obj.data] = bpy.data.meshes
             elif obj.type == 'ARMATURE':
                 objects.extend(obj.children)
-                bpy.data.armatures.remove(obj.data)
+                datablocks[obj.data] = bpy.data.armatures
             elif obj.type == 'CURVE':
-                bpy.data.curves.remove(obj.data)
+                datablocks[obj.data] = bpy.data.curves
             elif obj.type == 'EMPTY':
                 objects.extend(obj.children)
-                bpy.data.objects.remove(obj)
+            else:
+                continue
+            removed_objects.append(obj)
+
+        for obj in removed_objects:
+            bpy.data.objects.remove(obj)
+
+        # Remove the data and materials only once the objects using them are
+        # gone so data shared with other assets is left untouched
+        for datablock, data_collection in datablocks.items():
+            if not datablock.users:
+                data_collection.remove(datablock, do_unlink=False)
+        for material in materials:
+            if not material.users:
+                bpy.data.materials.remove(material, do_unlink=False)
 
     def _process(self, libpath, asset_group, group_name, action):
-        plugin.deselect_all()
+        if bpy.context.view_layer.objects.selected:
+            plugin.deselect_all()
 
         collection = bpy.context.view_layer.active_layer_collection.collection
 
@@ -86,11 +107,13 @@ class FbxModelLoader(plugin.BlenderLoader):
 
         objects.reverse()
 
+        # Link, rename and imprint in a single pass over the imported objects.
+        # Every object still needs linking to the scene collection, otherwise
+        # it would be orphaned once unlinked from the active collection.
         for obj in objects:
             parent.objects.link(obj)
             collection.objects.unlink(obj)
 
-        for obj in objects:
             name = obj.name
             obj.name = f"{group_name}:{name}"
             if obj.type != 'EMPTY':
@@ -109,11 +132,7 @@ class FbxModelLoader(plugin.BlenderLoader):
                     name_action = anim_data.action.name
                     anim_data.action.name = f"{group_name}:{name_action}"
 
-            if not obj.get(AVALON_PROPERTY):
-                obj[AVALON_PROPERTY] = dict()
-
-            avalon_info = obj[AVALON_PROPERTY]
-            avalon_info.update({"container_name": group_name})
+            obj[AVALON_PROPERTY] = {"container_name": group_name}
 
         plugin.deselect_all()
 
@@ -151,13 +170,6 @@ class FbxModelLoader(plugin.BlenderLoader):
 
         objects = self._process(libpath, asset_group, group_name, None)
 
-        objects = []
-        nodes = list(asset_group.children)
-
-        for obj in nodes:
-            objects.append(obj)
-            nodes.extend(list(obj.children))
-
         bpy.context.scene.collection.objects.link(asset_group)
 
         asset_group[AVALON_PROPERTY] = {
@@ -196,11 +208,12 @@ class FbxModelLoader(plugin.BlenderLoader):
         libpath = Path(get_representation_path(repre_entity))
         extension = libpath.suffix.lower()
 
-        self.log.info(
-            "Container: %s\nRepresentation: %s",
-            pformat(container, indent=2),
-            pformat(repre_entity, indent=2),
-        )
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(
+                "Container: %s\nRepresentation: %s",
+                pformat(container, indent=2),
+                pformat(repre_entity, indent=2),
+            )
 
         assert asset_group, (
             f"The asset is not loaded: {container['objectName']}"
@@ -218,18 +231,12 @@ class FbxModelLoader(plugin.BlenderLoader):
         metadata = asset_group.get(AVALON_PROPERTY)
         group_libpath = metadata["libpath"]
 
-        normalized_group_libpath = (
-            str(Path(bpy.path.abspath(group_libpath)).resolve())
-        )
-        normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
-        )
         self.log.debug(
-            "normalized_group_libpath:\n  %s\nnormalized_libpath:\n  %s",
-            normalized_group_libpath,
-            normalized_libpath,
+            "group_libpath:\n  %s\nlibpath:\n  %s",
+            group_libpath,
+            libpath,
         )
-        if normalized_group_libpath == normalized_libpath:
+        if plugin.is_same_libpath(group_libpath, libpath):
             self.log.info("Library already loaded, not updating...")
             return
 
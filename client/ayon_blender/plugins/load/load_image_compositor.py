@@ -31,16 +31,18 @@ class LoadImageCompositor(plugin.BlenderLoader):
         """
         path = self.filepath_from_context(context)
 
+        scene = bpy.context.scene
+
         # Enable nodes to ensure they can be loaded
-        if not bpy.context.scene.use_nodes:
+        if not scene.use_nodes:
             self.log.info("Enabling 'use nodes' for Compositor")
-            bpy.context.scene.use_nodes = True
+            scene.use_nodes = True
 
         # Load the image in data
         image = bpy.data.images.load(path, check_existing=True)
 
         # Get the current scene's compositor node tree
-        node_tree = bpy.context.scene.node_tree
+        node_tree = scene.node_tree
 
         # Create a new image node
         img_comp_node = node_tree.nodes.new(type='CompositorNodeImage')
@@ -66,7 +68,7 @@ class LoadImageCompositor(plugin.BlenderLoader):
         image: Optional[bpy.types.Image] = img_comp_node.image
 
         # Delete the compositor node
-        bpy.context.scene.node_tree.nodes.remove(img_comp_node)
+        img_comp_node.id_data.nodes.remove(img_comp_node)
 
         # Delete the image if it remains unused
         self.remove_image_if_unused(image)
@@ -116,7 +118,10 @@ class LoadImageCompositor(plugin.BlenderLoader):
             if ext in VIDEO_EXTENSIONS:
                 source = "MOVIE"
 
-        image.source = source
+        # Only write properties that changed to avoid needlessly tagging
+        # the image for reload (which rescans sequences on disk)
+        if image.source != source:
+            image.source = source
 
         # Set duration on the compositor node if sequence is used
         if source in {"SEQUENCE", "MOVIE"}:
@@ -128,20 +133,23 @@ class LoadImageCompositor(plugin.BlenderLoader):
             frame_start_handle = frame_start - handle_start
             frame_end_handle = frame_end + handle_end
             duration: int = frame_end_handle - frame_start_handle + 1
-            image_comp_node.frame_duration = duration
+            frame_offset = 0
             if source == "SEQUENCE":
+                frame_offset = frame_start_handle - 1
+
+            if image_comp_node.frame_duration != duration:
+                image_comp_node.frame_duration = duration
+            if image_comp_node.frame_start != frame_start_handle:
                 image_comp_node.frame_start = frame_start_handle
-                image_comp_node.frame_offset = frame_start_handle - 1
-            else:
-                image_comp_node.frame_start = frame_start_handle
-                image_comp_node.frame_offset = 0
+            if image_comp_node.frame_offset != frame_offset:
+                image_comp_node.frame_offset = frame_offset
 
         # Set colorspace if representation has colorspace data
         colorspace_data = representation.get("data", {}).get(
             "colorspaceData", {})
         if colorspace_data:
             colorspace: str = colorspace_data["colorspace"]
-            if colorspace:
+            if colorspace and image.colorspace_settings.name != colorspace:
                 image.colorspace_settings.name = colorspace
 
     def remove_image_if_unused(self, image: bpy.types.Image):
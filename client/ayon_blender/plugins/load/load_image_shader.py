@@ -7,6 +7,9 @@ from ayon_core.tools.utils import host_tools
 from ayon_blender.api import plugin, lib
 from ayon_blender.api.pipeline import AVALON_CONTAINER_ID
 
+# Object types whose data can hold materials for the image texture
+TARGET_OBJECT_TYPES = {"MESH", "SURFACE"}
+
 
 class LoadImageShaderEditor(plugin.BlenderLoader):
     """Load a product to the Shader Editor for selected mesh in Blender."""
@@ -27,27 +30,21 @@ class LoadImageShaderEditor(plugin.BlenderLoader):
             name: Use pre-defined name
             namespace: Use pre-defined namespace
             context: Full parenthood of representation to load
-            options: Additional settings dictionary
+            options: Additional settings dictionary. A pre-resolved
+                `target_object` can be passed to skip the selection lookup,
+                e.g. when loading many images from a script.
         """
 
-        # In the current objects selection, I get the first one that is a
-        # MESH or a SURFACE.
-        # TODO: We tend to avoid acting on 'user selection' so that the loaders
-        #  can run completely automatically, without user interaction or popups
-        #  So we may want to investigate different approaches to this.
-        selected_objects = lib.get_selection()
-        for obj in selected_objects:
-            if obj.type in {'MESH', 'SURFACE'}:
-                cur_obj = obj
-                break
-        else:
-            self.log.info(
+        cur_obj = (options or {}).get("target_object")
+        if cur_obj is None:
+            cur_obj = self.get_selected_object()
+        elif cur_obj.type not in TARGET_OBJECT_TYPES:
+            self.log.warning(
                 "Load in Shader Editor: The process (image load) was "
-                "cancelled, because no object (mesh or surface) was selected "
-                "in Blender.")
-            self.display_warning(
-                "You did not select any object in Blender.\n"
-                "So this process is cancelled.")
+                "cancelled, because the target object '%s' is not a mesh "
+                "or a surface.", cur_obj.name)
+            return []
+        if cur_obj is None:
             return []
 
         # If the currently selected object has one or more materials, let's use
@@ -59,7 +56,8 @@ class LoadImageShaderEditor(plugin.BlenderLoader):
             cur_obj.data.materials.append(current_material)
         else:
             current_material = cur_obj.data.materials[0]
-            current_material.use_nodes = True
+            if not current_material.use_nodes:
+                current_material.use_nodes = True
 
         nodes = current_material.node_tree.nodes
 
@@ -71,7 +69,7 @@ class LoadImageShaderEditor(plugin.BlenderLoader):
 
         # Load the image in data
         path = self.filepath_from_context(context)
-        image = bpy.data.images.load(path)
+        image = bpy.data.images.load(path, check_existing=True)
         image_texture_node.image = image
 
         self.set_colorspace(context, image_texture_node)
@@ -88,6 +86,29 @@ class LoadImageShaderEditor(plugin.BlenderLoader):
 
         return [image_texture_node]
 
+    def get_selected_object(self) -> Optional[bpy.types.Object]:
+        """Return the first selected mesh or surface object.
+
+        Warns the user when no such object is selected.
+        """
+        # In the current objects selection, I get the first one that is a
+        # MESH or a SURFACE.
+        # TODO: We tend to avoid acting on 'user selection' so that the loaders
+        #  can run completely automatically, without user interaction or popups
+        #  So we may want to investigate different approaches to this.
+        for obj in lib.get_selection():
+            if obj.type in TARGET_OBJECT_TYPES:
+                return obj
+
+        self.log.info(
+            "Load in Shader Editor: The process (image load) was "
+            "cancelled, because no object (mesh or surface) was selected "
+            "in Blender.")
+        self.display_warning(
+            "You did not select any object in Blender.\n"
+            "So this process is cancelled.")
+        return None
+
     def exec_remove(self, container: Dict) -> bool:
         """Remove the Image Texture node."""
 
@@ -110,7 +131,7 @@ class LoadImageShaderEditor(plugin.BlenderLoader):
 
         old_image: Optional[bpy.types.Image] = image_texture_node.image
 
-        new_image = bpy.data.images.load(path)
+        new_image = bpy.data.images.load(path, check_existing=True)
         image_texture_node.image = new_image
 
         self.set_colorspace(context, image_texture_node)
@@ -146,6 +167,11 @@ class LoadImageShaderEditor(plugin.BlenderLoader):
             bpy.data.images.remove(image)
 
     def display_warning(self, message):
+        if bpy.app.background:
+            # No UI to show the dialog in, it would block forever
+            self.log.warning(message)
+            return
+
         loader_gui_window = host_tools.get_tool_by_name("loader")
 
         QtWidgets.QMessageBox.warning(
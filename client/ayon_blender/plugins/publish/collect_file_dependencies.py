@@ -1,4 +1,5 @@
-from pathlib import Path
+import itertools
+import os
 
 import pyblish.api
 
@@ -21,16 +22,23 @@ class CollectFileDependencies(pyblish.api.ContextPlugin):
 
     def process(self, context):
         dependencies = set()
-
-        # Add alembic files as dependencies
-        for cache in bpy.data.cache_files:
-            dependencies.add(
-                Path(bpy.path.abspath(cache.filepath)).resolve().as_posix())
-
-        # Add image files as dependencies
-        for image in bpy.data.images:
-            if image.filepath:
-                dependencies.add(Path(
-                    bpy.path.abspath(image.filepath)).resolve().as_posix())
+        blend_dir = os.path.dirname(bpy.data.filepath)
+
+        # Add alembic and image files as dependencies. Paths are only
+        # normalized as strings to avoid hitting the filesystem per file.
+        for datablock in itertools.chain(
+            bpy.data.cache_files, bpy.data.images
+        ):
+            filepath = datablock.filepath
+            if not filepath:
+                continue
+            if datablock.library is not None:
+                # Relative to the linked library instead of this file
+                filepath = bpy.path.abspath(
+                    filepath, library=datablock.library)
+            elif filepath.startswith("//"):
+                filepath = os.path.join(blend_dir, filepath[2:])
+            filepath = os.path.abspath(filepath)
+            dependencies.add(filepath.replace("\\", "/"))
 
         context.data["fileDependencies"] = list(dependencies)
@@ -22,17 +22,21 @@ class CollectBlenderInstanceData(plugin.BlenderInstancePlugin):
         # Collect members of the instance
         members = [instance_node]
         if isinstance(instance_node, bpy.types.Collection):
-            members.extend(instance_node.objects)
+            is_animation = instance.data["productType"] == "animation"
+            for obj in instance_node.objects:
+                members.append(obj)
+
+                # Special case for animation instances, include armatures
+                if (
+                    is_animation
+                    and obj.type == 'EMPTY'
+                    and obj.get(AVALON_PROPERTY)
+                ):
+                    members.extend(
+                        child for child in obj.children
+                        if child.type == 'ARMATURE'
+                    )
             members.extend(instance_node.children)
-
-            # Special case for animation instances, include armatures
-            if instance.data["productType"] == "animation":
-                for obj in instance_node.objects:
-                    if obj.type == 'EMPTY' and obj.get(AVALON_PROPERTY):
-                        members.extend(
-                            child for child in obj.children
-                            if child.type == 'ARMATURE'
-                        )
         elif isinstance(instance_node, bpy.types.Object):
             members.extend(instance_node.children_recursive)
         else:
@@ -1,6 +1,13 @@
 import pyblish.api
 from ayon_blender.api import plugin
 
+FRAME_KEYS = frozenset({
+    "frameStart",
+    "frameEnd",
+    "handleStart",
+    "handleEnd"
+})
+
 
 class CollectFrameRangeFromCreator(plugin.BlenderInstancePlugin):
 
@@ -10,18 +17,18 @@ class CollectFrameRangeFromCreator(plugin.BlenderInstancePlugin):
     label = "Collect Frame Range from creator"
 
     def process(self, instance):
-        creator_attributes: dict = instance.data.get("creator_attributes", {})
-        frame_keys = [
-            "frameStart",
-            "frameEnd",
-            "handleStart",
-            "handleEnd"
-        ]
-        for key in frame_keys:
-            if key in creator_attributes:
-                instance.data[key] = creator_attributes[key]
+        creator_attributes: dict = (
+            instance.data.get("creator_attributes") or {})
+        frame_keys = FRAME_KEYS & creator_attributes.keys()
+        if not frame_keys:
+            # Instance does not define a frame range, e.g. image products
+            return
+
+        instance.data.update({
+            key: creator_attributes[key] for key in frame_keys
+        })
 
-        if all(key in instance.data for key in frame_keys):
+        if FRAME_KEYS <= instance.data.keys():
             # Calculate frameStartHandle and frameEndHandle
             instance.data["frameStartHandle"] = (
                 instance.data["frameStart"] - instance.data["handleStart"]
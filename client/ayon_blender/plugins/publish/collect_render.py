@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Collect render data."""
 
-import os
 import re
 
 import bpy
@@ -11,6 +10,9 @@ import ayon_api
 from ayon_blender.api import colorspace, plugin
 from ayon_core.pipeline.create import get_product_name
 
+# Last run of `#` in the file name, which Blender replaces with the frame
+FRAME_TOKEN_REGEX = re.compile(r"#+(?=[^#/]*$)")
+
 
 class CollectBlenderRender(plugin.BlenderInstancePlugin):
     """Gather all publishable render instances."""
@@ -30,20 +32,26 @@ class CollectBlenderRender(plugin.BlenderInstancePlugin):
         render. This returns a list of files that should be rendered. It
         replaces the sequence of `#` with the frame number.
         """
+        frames = range(frame_start, frame_end + 1, frame_step)
+        if not frames:
+            return {render_name: [] for render_name, _ in render_product}
+
         expected_files = {}
-        aov_files = []
         for render_name, render_file in render_product:
-            path = os.path.dirname(render_file)
-            file = os.path.basename(render_file)
-
-            for frame in range(frame_start, frame_end + 1, frame_step):
-                frame_str = str(frame).rjust(4, "0")
-                filename = re.sub("#+", frame_str, file)
-                expected_file = f"{os.path.join(path, filename)}.{ext}"
-                aov_files.append(expected_file.replace("\\", "/"))
-
+            render_file = render_file.replace("\\", "/")
+            match = FRAME_TOKEN_REGEX.search(render_file)
+            if not match:
+                expected_files[render_name] = (
+                    [f"{render_file}.{ext}"] * len(frames))
+                continue
+
+            # Split around the frame token once so each frame is a plain
+            # concatenation, padded to the number of `#` like Blender does
+            head = render_file[:match.start()]
+            tail = f"{render_file[match.end():]}.{ext}"
+            padding = match.end() - match.start()
             expected_files[render_name] = [
-                aov for aov in aov_files if render_name in aov
+                head + str(frame).zfill(padding) + tail for frame in frames
             ]
 
         return expected_files
@@ -63,21 +71,58 @@ class CollectBlenderRender(plugin.BlenderInstancePlugin):
 
         frame_start = instance.data["frameStartHandle"]
         frame_end = instance.data["frameEndHandle"]
-        project_name = instance.context.data["projectName"]
-        folder_entity = ayon_api.get_folder_by_path(
-            project_name,
-            instance.data["folderPath"]
-        )
+        # Entities are queried for all render instances at once
+        # by `CollectRenderEntities`, the server is only queried directly
+        # when the entity was not collected there
+        project_name = context.data["projectName"]
+        folder_entities_by_path = context.data.get(
+            "renderFolderEntitiesByPath", {})
+        task_entities_by_key = context.data.get("renderTaskEntitiesByKey", {})
+        folder_path = instance.data["folderPath"]
+        folder_entity = folder_entities_by_path.get(folder_path)
+        if folder_entity is None:
+            folder_entity = ayon_api.get_folder_by_path(
+                project_name, folder_path)
         task_name = instance.data.get("task")
         task_entity = None
         if folder_entity and task_name:
-            task_entity = ayon_api.get_task_by_name(
-                project_name, folder_entity["id"], task_name
-            )
+            task_entity = task_entities_by_key.get(
+                (folder_entity["id"], task_name))
+            if task_entity is None:
+                task_entity = ayon_api.get_task_by_name(
+                    project_name, folder_entity["id"], task_name
+                )
         instance.data["integrate"] = False
 
+        scene = bpy.context.scene
+        frame_step = int(scene.frame_step)
+
         prod_type = "render"
-        for view_layer in bpy.context.scene.view_layers:
+        # Data shared by the instances of all view layers
+        layer_instance_data = {
+            "family": prod_type,
+            "fps": context.data["fps"],
+            "byFrameStep": instance.data["creator_attributes"].get("step", 1),
+            "review": render_data.get("review", False),
+            "multipartExr": ext == "exr" and multilayer,
+            "farm": True,
+            "folderPath": instance.data["folderPath"],
+            "productType": prod_type,
+            "frameStart": instance.data["frameStart"],
+            "frameEnd": instance.data["frameEnd"],
+            "frameStartHandle": frame_start,
+            "frameEndHandle": frame_end,
+            "task": instance.data["task"],
+            # OCIO not currently implemented in Blender, but the following
+            # settings are required by the schema, so it is hardcoded.
+            # TODO: Implement OCIO in Blender
+            "colorspaceConfig": "",
+            "colorspaceDisplay": "sRGB",
+            "colorspaceView": "ACES 1.0 SDR-video",
+            "publish_attributes": instance.data["publish_attributes"]
+        }
+
+        for view_layer in scene.view_layers:
             viewlayer_name = view_layer.name
             rn_product = render_product[viewlayer_name]
             aov_product = aov_file_product[viewlayer_name] if aov_file_product else {}
@@ -90,45 +135,28 @@ class CollectBlenderRender(plugin.BlenderInstancePlugin):
                 variant=instance.data["variant"] + viewlayer_name,
                 project_settings=context.data["project_settings"]
             )
-            rn_layer_instance = context.create_instance(viewlayer_product_name)
-            rn_layer_instance[:] = instance[:]
             expected_beauty = self.generate_expected_files(
                 rn_product, int(frame_start), int(frame_end),
-                int(bpy.context.scene.frame_step), ext)
+                frame_step, ext)
 
             expected_aovs = self.generate_expected_files(
                 aov_product, int(frame_start), int(frame_end),
-                int(bpy.context.scene.frame_step), ext)
+                frame_step, ext)
 
             expected_files = expected_beauty | expected_aovs
-            rn_layer_instance.data.update({
-                "family": prod_type,
-                "families": [prod_type, "render.farm"],
-                "fps": context.data["fps"],
-                "byFrameStep": instance.data["creator_attributes"].get("step", 1),
-                "review": render_data.get("review", False),
-                "multipartExr": ext == "exr" and multilayer,
-                "farm": True,
-                "folderPath": instance.data["folderPath"],
-                "productName": viewlayer_product_name,
-                "productType": prod_type,
-                "expectedFiles": [expected_files],
-                "frameStart": instance.data["frameStart"],
-                "frameEnd": instance.data["frameEnd"],
-                "frameStartHandle": frame_start,
-                "frameEndHandle": frame_end,
-                "task": instance.data["task"],
-                # OCIO not currently implemented in Blender, but the following
-                # settings are required by the schema, so it is hardcoded.
-                # TODO: Implement OCIO in Blender
-                "colorspaceConfig": "",
-                "colorspaceDisplay": "sRGB",
-                "colorspaceView": "ACES 1.0 SDR-video",
-                "renderProducts": colorspace.ARenderProduct(
+            # Pass the data on creation so it is only merged into the
+            # instance data once
+            rn_layer_instance = context.create_instance(
+                viewlayer_product_name,
+                **layer_instance_data,
+                families=[prod_type, "render.farm"],
+                productName=viewlayer_product_name,
+                expectedFiles=[expected_files],
+                renderProducts=colorspace.ARenderProduct(
                     frame_start=frame_start,
                     frame_end=frame_end
                 ),
-                "publish_attributes": instance.data["publish_attributes"]
-            })
+            )
+            rn_layer_instance[:] = instance[:]
             instance.append(rn_layer_instance)
             self.log.debug([expected_files])
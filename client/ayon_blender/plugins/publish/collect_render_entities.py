@@ -0,0 +1,62 @@
+import pyblish.api
+import ayon_api
+
+from ayon_blender.api import plugin
+
+
+class CollectRenderEntities(plugin.BlenderContextPlugin):
+    """Query folder and task entities of all render instances at once.
+
+    Fetching the entities per instance results in two server requests for
+    each render instance, so they are queried in bulk here and stored on the
+    context for `CollectBlenderRender` to look up.
+    """
+
+    order = pyblish.api.CollectorOrder + 0.005
+    hosts = ["blender"]
+    families = ["renderlayer"]
+    label = "Collect Render Entities"
+
+    def process(self, context):
+        project_name = context.data["projectName"]
+        task_names_by_folder_path = {}
+        for instance in context:
+            if instance.data.get("productType") != "renderlayer":
+                continue
+            folder_path = instance.data.get("folderPath")
+            if not folder_path:
+                continue
+            task_names = task_names_by_folder_path.setdefault(
+                folder_path, set())
+            task_name = instance.data.get("task")
+            if task_name:
+                task_names.add(task_name)
+
+        if not task_names_by_folder_path:
+            return
+
+        folder_entities_by_path = {
+            folder_entity["path"]: folder_entity
+            for folder_entity in ayon_api.get_folders(
+                project_name, folder_paths=set(task_names_by_folder_path)
+            )
+        }
+
+        task_names = set()
+        for task_names_of_folder in task_names_by_folder_path.values():
+            task_names |= task_names_of_folder
+
+        task_entities_by_key = {}
+        if folder_entities_by_path and task_names:
+            folder_ids = {
+                folder_entity["id"]
+                for folder_entity in folder_entities_by_path.values()
+            }
+            for task_entity in ayon_api.get_tasks(
+                project_name, folder_ids=folder_ids, task_names=task_names
+            ):
+                key = (task_entity["folderId"], task_entity["name"])
+                task_entities_by_key[key] = task_entity
+
+        context.data["renderFolderEntitiesByPath"] = folder_entities_by_path
+        context.data["renderTaskEntitiesByKey"] = task_entities_by_key
@@ -1,7 +1,8 @@
-import bpy
 import pyblish.api
 from ayon_blender.api import plugin
 
+ISOLATE_TYPES = frozenset({"MESH", "GPENCIL"})
+
 
 class CollectReview(plugin.BlenderInstancePlugin):
     """Collect Review data
@@ -14,31 +15,33 @@ class CollectReview(plugin.BlenderInstancePlugin):
 
     def process(self, instance):
 
-        self.log.debug(f"instance: {instance}")
+        self.log.debug("instance: %s", instance)
 
         datablock = instance.data["transientData"]["instance_node"]
 
-        # get cameras
-        cameras = [
-            obj
-            for obj in datablock.all_objects
-            if isinstance(obj, bpy.types.Object) and obj.type == "CAMERA"
-        ]
+        # get cameras, stop early once more than one is found since that
+        # already fails the check below
+        cameras = []
+        for obj in datablock.all_objects:
+            if obj.type == "CAMERA":
+                cameras.append(obj)
+                if len(cameras) > 1:
+                    break
 
         assert len(cameras) == 1, (
             f"Not a single camera found in extraction: {cameras}"
         )
         camera = cameras[0].name
-        self.log.debug(f"camera: {camera}")
+        self.log.debug("camera: %s", camera)
 
         focal_length = cameras[0].data.lens
 
         # get isolate objects list from meshes instance members.
-        types = {"MESH", "GPENCIL"}
         isolate_objects = [
             obj
             for obj in instance
-            if isinstance(obj, bpy.types.Object) and obj.type in types
+            # Members may also be collections, which have no `type`
+            if getattr(obj, "type", None) in ISOLATE_TYPES
         ]
 
         # Store focal length in `burninDataMembers`
@@ -51,7 +54,7 @@ class CollectReview(plugin.BlenderInstancePlugin):
             "isolate": isolate_objects,
         })
 
-        self.log.debug(f"instance data: {instance.data}")
+        self.log.debug("instance data: %s", instance.data)
 
         # TODO : Collect audio
         # audio_tracks = []
@@ -25,7 +25,7 @@ class CollectWorkfile(plugin.BlenderInstancePlugin):
             return
 
         filepath = Path(filepath)
-        ext = filepath.suffix
+        ext = filepath.suffix.lstrip(".")
 
         instance.data.update(
             {
@@ -36,8 +36,8 @@ class CollectWorkfile(plugin.BlenderInstancePlugin):
                 "handledEnd": context.data.get("handleEnd", 1),
                 "representations": [
                     {
-                        "name": ext.lstrip("."),
-                        "ext": ext.lstrip("."),
+                        "name": ext,
+                        "ext": ext,
                         "files": filepath.name,
                         "stagingDir": filepath.parent,
                     }